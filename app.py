@@ -1,36 +1,38 @@
-import json
+import hashlib
+import math
+import mmap
 import os
 import time
+from collections import Counter, deque
 from datetime import datetime
-from typing import Optional, AsyncGenerator
+from typing import Annotated, List, Optional, AsyncGenerator, Tuple
 import asyncio
 
-from fastapi import FastAPI, HTTPException, Request
+import cachetools
+import httpx
+import orjson
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
-from pydantic import BaseModel, field_validator
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, StringConstraints
+from sse_starlette.sse import EventSourceResponse
 import uvicorn
 import ollama
 
 # Pydantic models for request/response validation
 class GenerateRequest(BaseModel):
-    prompt: str
+    # Stripping and the empty/length checks run inside pydantic-core (Rust),
+    # replacing the old Python field_validator
+    prompt: Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=10000)]
     stream: Optional[bool] = False
-    
-    @field_validator('prompt')
-    @classmethod
-    def validate_prompt(cls, v):
-        if not v or not v.strip():
-            raise ValueError('Prompt cannot be empty')
-        if len(v.strip()) > 10000:  # Reasonable limit
-            raise ValueError('Prompt too long (max 10000 characters)')
-        return v.strip()
 
 class GenerateResponse(BaseModel):
     response: str
     model: str = "minivault-ollama"
     response_time_ms: int
 
+# Documents the error shape in the OpenAPI schema; error paths raise
+# with plain dicts of this shape rather than instantiating it
 class ErrorResponse(BaseModel):
     error: str
     detail: str
@@ -41,7 +43,8 @@ class ErrorResponse(BaseModel):
 app = FastAPI(
     title="MiniVault API",
     description="A lightweight local REST API with Ollama integration",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -57,57 +60,433 @@ app.add_middleware(
 OLLAMA_HOST = os.getenv("OLLAMA_HOST", "http://ollama:11434")
 OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "tinyllama:latest")
 
+# One shared connection pool for all Ollama traffic - keep-alive avoids a
+# TCP handshake per request
+ollama_async_client = ollama.AsyncClient(
+    host=OLLAMA_HOST,
+    timeout=60,
+    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+)
+
+class ResponseCache:
+    """In-memory LRU cache so repeated prompts skip Ollama inference entirely"""
+
+    def __init__(self, maxsize: int = 1024):
+        self.cache = cachetools.LRUCache(maxsize=maxsize)
+        self.lock = asyncio.Lock()
+
+    @staticmethod
+    def make_key(prompt: str) -> bytes:
+        """Build a cache key from the model name and normalized prompt"""
+        return hashlib.sha256((OLLAMA_MODEL + "\x00" + prompt).encode()).digest()
+
+    async def get(self, key: bytes) -> Optional[str]:
+        async with self.lock:
+            return self.cache.get(key)
+
+    async def put(self, key: bytes, value: str):
+        async with self.lock:
+            self.cache[key] = value
+
+class SemanticCache:
+    """Embedding-based cache that matches near-duplicate prompts
+
+    Many prompts are paraphrases of each other ("What is Python?" vs
+    "what's python"). Embeddings from Ollama let those share one cached
+    answer; a single similarity scan replaces a multi-second generation.
+    The exact-match ResponseCache stays in front as the fast path.
+    """
+
+    def __init__(self, maxsize: int = 512, threshold: float = 0.92):
+        self.maxsize = maxsize
+        self.threshold = threshold
+        self.vectors: List[List[float]] = []
+        self.responses: List[str] = []
+        self.lock = asyncio.Lock()
+        self.client = ollama_async_client
+
+    async def embed(self, prompt: str) -> Optional[List[float]]:
+        """Embed a prompt via Ollama; returns None if embeddings are unavailable"""
+        try:
+            result = await self.client.embeddings(model=OLLAMA_MODEL, prompt=prompt)
+            return result["embedding"]
+        except Exception:
+            # Semantic caching is best-effort - fall back to normal generation
+            return None
+
+    @staticmethod
+    def cosine_similarity(a: List[float], b: List[float]) -> float:
+        dot = sum(x * y for x, y in zip(a, b))
+        norm_a = math.sqrt(sum(x * x for x in a))
+        norm_b = math.sqrt(sum(y * y for y in b))
+        if not norm_a or not norm_b:
+            return 0.0
+        return dot / (norm_a * norm_b)
+
+    async def lookup(self, prompt: str) -> Tuple[Optional[str], Optional[List[float]]]:
+        """Find a cached response for a similar prompt
+
+        Returns (response, embedding); the embedding is reused by add()
+        so a miss only pays for one embedding call.
+        """
+        vector = await self.embed(prompt)
+        if vector is None:
+            return None, None
+
+        # Snapshot under the lock, scan off the loop: a Python-level
+        # cosine pass over a full cache of 2048-dim embeddings takes tens
+        # of milliseconds - far too long to block the event loop for,
+        # let alone while holding the lock
+        async with self.lock:
+            vectors = list(self.vectors)
+            responses = list(self.responses)
+
+        if not vectors:
+            return None, vector
+
+        best_response, best_similarity = await asyncio.to_thread(
+            self._scan, vector, vectors, responses
+        )
+        if best_response is not None and best_similarity >= self.threshold:
+            return best_response, vector
+        return None, vector
+
+    @staticmethod
+    def _scan(query: List[float], vectors: List[List[float]],
+              responses: List[str]) -> Tuple[Optional[str], float]:
+        """Blocking similarity scan; runs in a worker thread"""
+        best_response = None
+        best_similarity = 0.0
+        for stored_vector, stored_response in zip(vectors, responses):
+            similarity = SemanticCache.cosine_similarity(query, stored_vector)
+            if similarity > best_similarity:
+                best_similarity = similarity
+                best_response = stored_response
+        return best_response, best_similarity
+
+    async def add(self, vector: Optional[List[float]], response_text: str):
+        """Store a generated response under its prompt embedding"""
+        if vector is None:
+            return
+        async with self.lock:
+            if len(self.vectors) >= self.maxsize:
+                self.vectors.pop(0)
+                self.responses.pop(0)
+            self.vectors.append(vector)
+            self.responses.append(response_text)
+
 class OllamaClient:
     """Ollama client for generating responses"""
     
     def __init__(self):
-        # Configure ollama client to use our host
-        self.client = ollama.AsyncClient(host=OLLAMA_HOST)
+        # Reuse the shared pooled client
+        self.client = ollama_async_client
     
     async def generate_response(self, prompt: str) -> str:
-        """Generate a response using Ollama"""
-        try:
-            message = {'role': 'user', 'content': prompt}
-            response = await self.client.chat(
-                model=OLLAMA_MODEL,
-                messages=[message],
-                stream=False
-            )
-            return response.message['content']
-        except Exception as e:
-            # Fallback response if Ollama is unavailable
-            return f"I understand your request about '{prompt[:50]}...'. However, I'm currently unable to connect to the language model service. Please ensure the Ollama service is running and try again."
+        """Generate a response using Ollama
+
+        Raises on failure so the caller can tell a real generation from
+        the fallback and avoid caching error text.
+        """
+        message = {'role': 'user', 'content': prompt}
+        response = await self.client.chat(
+            model=OLLAMA_MODEL,
+            messages=[message],
+            stream=False
+        )
+        return response.message['content']
+
+    @staticmethod
+    def fallback_response(prompt: str) -> str:
+        """Canned response served when Ollama is unavailable"""
+        return f"I understand your request about '{prompt[:50]}...'. However, I'm currently unable to connect to the language model service. Please ensure the Ollama service is running and try again."
     
+    # Coalescing thresholds: flush buffered tokens at this size or age.
+    # 20ms of jitter is imperceptible, but it collapses hundreds of
+    # one-token ASGI sends into a handful
+    MAX_CHUNK_BYTES = 4096
+    MAX_CHUNK_AGE = 0.02
+
     async def generate_stream(self, prompt: str) -> AsyncGenerator[str, None]:
-        """Generate a streaming response using Ollama"""
+        """Generate a streaming response using Ollama
+
+        Ollama often emits one token per chunk; buffer them briefly so each
+        yield (and therefore each HTTP chunk) carries a meaningful payload.
+        """
         try:
             message = {'role': 'user', 'content': prompt}
-            async for chunk in await self.client.chat(model=OLLAMA_MODEL, messages=[message],stream=True):
-                yield chunk.message['content']
-                    
+            buffer = []
+            buffered_len = 0
+            last_flush = time.monotonic()
+            async for chunk in await self.client.chat(model=OLLAMA_MODEL, messages=[message], stream=True):
+                content = chunk.message['content']
+                buffer.append(content)
+                buffered_len += len(content)
+                now = time.monotonic()
+                if buffered_len >= self.MAX_CHUNK_BYTES or now - last_flush >= self.MAX_CHUNK_AGE:
+                    yield "".join(buffer)
+                    buffer.clear()
+                    buffered_len = 0
+                    last_flush = now
+            if buffer:
+                yield "".join(buffer)
+
         except Exception as e:
             # Fallback streaming response
             fallback_text = f"I understand your request about '{prompt[:50]}...'. However, I'm currently unable to connect to the language model service."
-            words = fallback_text.split()
-            for word in words:
+            for word in fallback_text.split():
                 yield word + " "
-                await asyncio.sleep(0.05)
 
 class Logger:
-    """Handles logging of all API interactions"""
-    
+    """Handles logging of all API interactions
+
+    Log lines are queued by the request path and written in batches by a
+    background task, so a request never pays for a file open or write.
+    """
+
+    FLUSH_INTERVAL = 0.1  # seconds between batch flushes
+    MAX_BATCH = 256       # max entries written per batch
+
     def __init__(self, log_file: str = "logs/log.jsonl"):
         self.log_file = log_file
+        self.stats_file = log_file + ".stats"
         self.ensure_log_directory()
-    
+        self.fh = open(self.log_file, "ab", buffering=1 << 20)
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.flush_task: Optional[asyncio.Task] = None
+        # Running aggregates so /logs/stats never has to rescan the file
+        self.stats = {
+            "total": 0,
+            "sum_response_time_ms": 0,
+            "sum_prompt_length": 0,
+            "min_response_time_ms": None,
+            "max_response_time_ms": 0,
+            "streaming": 0,
+            "model_usage": Counter(),
+            "recent": deque(maxlen=10000),  # epoch seconds of recent interactions
+        }
+        if self._load_stats_sidecar():
+            self._replay_recent_tail()
+        else:
+            self._replay_log()
+
     def ensure_log_directory(self):
         """Ensure the logs directory exists"""
         os.makedirs(os.path.dirname(self.log_file), exist_ok=True)
-    
+
+    @staticmethod
+    def _parse_entry(line: bytes) -> Optional[Tuple[dict, float]]:
+        """Parse one log line into (entry, epoch timestamp), or None if malformed"""
+        try:
+            entry = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            return None
+
+        # Current entries carry integer epoch milliseconds; fall back to the
+        # legacy ISO string for logs written before the schema change
+        ts_ms = entry.get("ts_ms")
+        if ts_ms is not None:
+            return entry, ts_ms / 1000.0
+        try:
+            timestamp = datetime.fromisoformat(
+                entry["timestamp"].replace("Z", "+00:00")
+            ).timestamp()
+        except (KeyError, ValueError):
+            return None
+        return entry, timestamp
+
+    def _fold_line(self, line: bytes):
+        """Fold one raw log line into the aggregates, skipping malformed lines"""
+        parsed = self._parse_entry(line)
+        if parsed is None:
+            return
+        entry, timestamp = parsed
+        self._record_stats(
+            entry.get("response_time_ms", 0),
+            entry.get("prompt_length", 0),
+            entry.get("stream", False),
+            entry.get("model", "unknown"),
+            timestamp
+        )
+
+    def _replay_log(self):
+        """Fold an existing log file into the in-memory aggregates once at startup
+
+        The file is mmap'd and sliced line by line, so the scan runs in
+        constant memory instead of materializing buffered lines for a
+        potentially multi-GB log.
+        """
+        try:
+            with open(self.log_file, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    start = 0
+                    while (newline := mm.find(b"\n", start)) != -1:
+                        line = mm[start:newline]
+                        start = newline + 1
+                        if line.strip():
+                            self._fold_line(line)
+                    # A final line without a trailing newline
+                    tail = mm[start:]
+                    if tail.strip():
+                        self._fold_line(tail)
+        except (OSError, ValueError):
+            pass
+
+    @staticmethod
+    def _sidecar_enabled() -> bool:
+        """Sidecar persistence is only sound with a single worker
+
+        With multiple workers each process holds counters for its own
+        share of the traffic but they all write the same sidecar file
+        (last writer wins), and exactly one worker would adopt those
+        partial counters on restart instead of replaying the shared log.
+        Mirror the worker count __main__ passes to uvicorn; DEV mode is
+        always a single worker.
+        """
+        if os.getenv("DEV"):
+            return True
+        return int(os.getenv("WEB_CONCURRENCY", (os.cpu_count() or 1) * 2 + 1)) == 1
+
+    def _load_stats_sidecar(self) -> bool:
+        """Restore counters persisted by a clean shutdown
+
+        The sidecar is removed after loading so a crashed process falls
+        back to a full replay instead of trusting stale counters. It is
+        only trusted when the log file size it recorded still matches -
+        anything appended since it was written means the counters no
+        longer cover the log.
+        """
+        if not self._sidecar_enabled():
+            return False
+        try:
+            with open(self.stats_file, "rb") as f:
+                saved = orjson.loads(f.read())
+            os.remove(self.stats_file)
+        except (OSError, orjson.JSONDecodeError):
+            return False
+
+        try:
+            log_size = os.path.getsize(self.log_file)
+        except OSError:
+            log_size = 0
+        if saved.get("log_size") != log_size:
+            return False
+
+        for key in ("total", "sum_response_time_ms", "sum_prompt_length", "streaming"):
+            self.stats[key] = saved.get(key, 0)
+        self.stats["min_response_time_ms"] = saved.get("min_response_time_ms")
+        self.stats["max_response_time_ms"] = saved.get("max_response_time_ms", 0)
+        self.stats["model_usage"] = Counter(saved.get("model_usage", {}))
+        return True
+
+    def _write_stats_sidecar(self):
+        """Persist counters so the next startup can skip the full replay"""
+        if not self._sidecar_enabled():
+            return
+        stats = self.stats
+        try:
+            # fh is already closed, so the size covers every flushed entry
+            log_size = os.path.getsize(self.log_file)
+            with open(self.stats_file, "wb") as f:
+                f.write(orjson.dumps({
+                    "log_size": log_size,
+                    "total": stats["total"],
+                    "sum_response_time_ms": stats["sum_response_time_ms"],
+                    "sum_prompt_length": stats["sum_prompt_length"],
+                    "min_response_time_ms": stats["min_response_time_ms"],
+                    "max_response_time_ms": stats["max_response_time_ms"],
+                    "streaming": stats["streaming"],
+                    "model_usage": dict(stats["model_usage"])
+                }))
+        except OSError as e:
+            print(f"Failed to write stats sidecar: {e}")
+
+    def _replay_recent_tail(self, window: int = 1 << 20):
+        """Rebuild the recent-timestamps deque from the tail of the log
+
+        The log is append-only and chronological, so the last ~1MB covers
+        the 24h window without re-reading the whole file.
+        """
+        cutoff = time.time() - 86400
+        try:
+            with open(self.log_file, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size > window:
+                    f.seek(size - window)
+                    f.readline()  # skip the partial line at the seek point
+                for line in f:
+                    if not line.strip():
+                        continue
+                    parsed = self._parse_entry(line)
+                    if parsed is not None and parsed[1] >= cutoff:
+                        self.stats["recent"].append(parsed[1])
+        except OSError:
+            pass
+
+    def _record_stats(self, response_time_ms: int, prompt_length: int, stream: bool, model: str, timestamp: float):
+        """Update the running aggregates for one interaction"""
+        stats = self.stats
+        stats["total"] += 1
+        stats["sum_response_time_ms"] += response_time_ms
+        stats["sum_prompt_length"] += prompt_length
+        if stats["min_response_time_ms"] is None or response_time_ms < stats["min_response_time_ms"]:
+            stats["min_response_time_ms"] = response_time_ms
+        if response_time_ms > stats["max_response_time_ms"]:
+            stats["max_response_time_ms"] = response_time_ms
+        if stream:
+            stats["streaming"] += 1
+        stats["model_usage"][model] += 1
+        stats["recent"].append(timestamp)
+
+    def start(self):
+        """Start the background flush task (called on app startup)"""
+        if self.flush_task is None:
+            self.flush_task = asyncio.create_task(self._flush_loop())
+
+    async def shutdown(self):
+        """Drain pending entries and close the log file (called on app shutdown)"""
+        if self.flush_task is not None:
+            self.flush_task.cancel()
+            try:
+                await self.flush_task
+            except asyncio.CancelledError:
+                pass
+            self.flush_task = None
+        self._write_pending()
+        self.fh.close()
+        self._write_stats_sidecar()
+
+    def _write_batch(self, batch: List[bytes]):
+        """Blocking write of one batch; runs in a worker thread"""
+        self.fh.write(b"".join(batch))
+        self.fh.flush()
+
+    def _write_pending(self):
+        """Write everything currently queued in a single batch"""
+        batch = []
+        while not self.queue.empty():
+            batch.append(self.queue.get_nowait())
+        if batch:
+            self._write_batch(batch)
+
+    async def _flush_loop(self):
+        """Batch queued log lines into one write per flush interval"""
+        while True:
+            line = await self.queue.get()
+            batch = [line]
+            while len(batch) < self.MAX_BATCH and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            # Keep the event loop free of disk I/O - a slow write must not
+            # stall in-flight requests
+            await asyncio.to_thread(self._write_batch, batch)
+            await asyncio.sleep(self.FLUSH_INTERVAL)
+
     def log_interaction(self, prompt: str, response: str, response_time_ms: int, model: str = "minivault-ollama", stream: bool = False):
-        """Log an interaction to the JSONL file"""
+        """Queue an interaction for the JSONL file"""
         log_entry = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "ts_ms": int(time.time() * 1000),
             "prompt": prompt,
             "response": response,
             "response_time_ms": response_time_ms,
@@ -116,17 +495,31 @@ class Logger:
             "prompt_length": len(prompt),
             "response_length": len(response)
         }
-        
+
         try:
-            with open(self.log_file, "a", encoding="utf-8") as f:
-                f.write(json.dumps(log_entry, ensure_ascii=False) + "\n")
+            # orjson emits UTF-8 bytes directly - no str round-trip
+            self.queue.put_nowait(orjson.dumps(log_entry) + b"\n")
         except Exception as e:
-            # Log to stderr if file logging fails
-            print(f"Failed to write to log file: {e}")
+            # Log to stderr if queueing fails
+            print(f"Failed to queue log entry: {e}")
+
+        self._record_stats(response_time_ms, len(prompt), stream, model, time.time())
 
 # Initialize components
 ollama_client = OllamaClient()
 logger = Logger()
+response_cache = ResponseCache()
+semantic_cache = SemanticCache()
+
+@app.on_event("startup")
+async def startup_event():
+    """Start the background log writer"""
+    logger.start()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Flush any pending log entries before exit"""
+    await logger.shutdown()
 
 @app.get("/")
 async def root():
@@ -142,75 +535,118 @@ async def root():
         "features": ["ollama_integration", "streaming_responses", "comprehensive_logging"]
     }
 
+# ISO timestamp cached at one-second granularity - cheap enough for every
+# health ping without re-running datetime formatting
+_ts_cache = {"second": 0, "iso": ""}
+
+def utc_now_iso() -> str:
+    """Current UTC time as an ISO-8601 string, cached per second"""
+    second = int(time.time())
+    if _ts_cache["second"] != second:
+        _ts_cache["second"] = second
+        _ts_cache["iso"] = datetime.utcfromtimestamp(second).isoformat() + "Z"
+    return _ts_cache["iso"]
+
+# Cached Ollama probe so load-balancer health pings don't hit Ollama each time
+_ollama_status_cache = {"checked_at": 0.0, "status": "unknown"}
+OLLAMA_STATUS_TTL = 5.0
+
+async def get_ollama_status() -> str:
+    """Probe Ollama, reusing the last result for a few seconds"""
+    now = time.monotonic()
+    if now - _ollama_status_cache["checked_at"] > OLLAMA_STATUS_TTL:
+        status = "connected"
+        try:
+            await ollama_client.client.list()
+        except Exception:
+            status = "disconnected"
+        _ollama_status_cache["checked_at"] = now
+        _ollama_status_cache["status"] = status
+    return _ollama_status_cache["status"]
+
 @app.get("/health")
 async def health_check():
     """Detailed health check"""
-    # Test Ollama connection
-    ollama_status = "connected"
-    try:
-        # Quick test to see if Ollama is responsive
-        ollama_client.client.list()
-    except Exception:
-        ollama_status = "disconnected"
-    
+    ollama_status = await get_ollama_status()
+
     return {
         "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat() + "Z",
-        "logs_directory": os.path.exists("logs"),
+        "timestamp": utc_now_iso(),
+        # Logger.__init__ creates the directory with makedirs, so no stat needed
+        "logs_directory": True,
         "api_version": "2.0.0",
         "ollama_host": OLLAMA_HOST,
         "ollama_model": OLLAMA_MODEL,
         "ollama_status": ollama_status
     }
 
-@app.post("/generate", response_model=GenerateResponse)
-async def generate_response(request: GenerateRequest):
+@app.post("/generate", response_model=GenerateResponse,
+          responses={500: {"model": ErrorResponse}})
+async def generate_response(request: GenerateRequest, response: Response):
     """Main endpoint for generating responses using Ollama"""
-    start_time = time.time()
-    
+    start_ns = time.perf_counter_ns()
+
     try:
         if request.stream:
-            # Return streaming response
-            async def generate() -> AsyncGenerator[str, None]:
+            # Return streaming response; EventSourceResponse handles SSE
+            # framing, keep-alive pings, and proxy-friendly headers
+            async def generate() -> AsyncGenerator[dict, None]:
                 full_response = ""
                 async for chunk in ollama_client.generate_stream(request.prompt):
                     full_response += chunk
-                    yield f"data: {chunk}\n\n"
-                
+                    yield {"data": chunk}
+
                 # Log the complete interaction
-                response_time_ms = int((time.time() - start_time) * 1000)
+                response_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
                 logger.log_interaction(request.prompt, full_response, response_time_ms, stream=True)
-            
-            return StreamingResponse(
-                generate(),
-                media_type="text/event-stream"
-            )
+
+            return EventSourceResponse(generate())
         else:
-            # Regular response
-            response_text = await ollama_client.generate_response(request.prompt)
-            response_time_ms = int((time.time() - start_time) * 1000)
-            
+            # Check the response cache first - a hit skips the Ollama call entirely
+            cache_key = ResponseCache.make_key(request.prompt)
+            response_text = await response_cache.get(cache_key)
+
+            if response_text is not None:
+                response.headers["X-Cache"] = "HIT"
+            else:
+                # Fall back to embedding similarity for paraphrased prompts
+                response_text, embedding = await semantic_cache.lookup(request.prompt)
+                if response_text is not None:
+                    response.headers["X-Cache"] = "HIT-SEMANTIC"
+                    await response_cache.put(cache_key, response_text)
+                else:
+                    response.headers["X-Cache"] = "MISS"
+                    try:
+                        response_text = await ollama_client.generate_response(request.prompt)
+                    except Exception:
+                        # Ollama is down - serve the fallback but never cache
+                        # it, so recovery is picked up on the next request
+                        response_text = ollama_client.fallback_response(request.prompt)
+                    else:
+                        await response_cache.put(cache_key, response_text)
+                        await semantic_cache.add(embedding, response_text)
+
+            response_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+
             # Log the interaction
             logger.log_interaction(request.prompt, response_text, response_time_ms)
-            
+
             return GenerateResponse(
                 response=response_text,
                 response_time_ms=response_time_ms
             )
             
     except Exception as e:
-        response_time_ms = int((time.time() - start_time) * 1000)
+        response_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         error_response = f"Error generating response: {str(e)}"
         
         # Log the error
         logger.log_interaction(request.prompt, error_response, response_time_ms)
         
+        # Plain dict - no need to validate fields we just set through Pydantic
         raise HTTPException(
             status_code=500,
-            detail=ErrorResponse(
-                error="Generation failed",
-                detail=str(e)
-            ).model_dump()
+            detail={"error": "Generation failed", "detail": str(e)}
         )
 
 @app.exception_handler(ValueError)
@@ -218,81 +654,63 @@ async def validation_exception_handler(request: Request, exc: ValueError):
     """Handle validation errors"""
     return HTTPException(
         status_code=400,
-        detail=ErrorResponse(
-            error="Validation error",
-            detail=str(exc)
-        ).model_dump()
+        detail={"error": "Validation error", "detail": str(exc)}
     )
 
 @app.get("/logs/stats")
 async def get_log_stats():
-    """Get statistics about logged interactions"""
-    log_file = "logs/log.jsonl"
-    
-    if not os.path.exists(log_file):
+    """Get statistics about logged interactions (served from in-memory aggregates)"""
+    stats = logger.stats
+    total_interactions = stats["total"]
+
+    if total_interactions == 0:
         return {
             "total_interactions": 0,
             "avg_response_time_ms": 0,
             "avg_prompt_length": 0,
             "recent_interactions": 0
         }
-    
-    try:
-        with open(log_file, "r", encoding="utf-8") as f:
-            logs = [json.loads(line.strip()) for line in f if line.strip()]
-        
-        if not logs:
-            return {
-                "total_interactions": 0,
-                "avg_response_time_ms": 0,
-                "avg_prompt_length": 0,
-                "recent_interactions": 0
-            }
-        
-        # Calculate statistics
-        total_interactions = len(logs)
-        avg_response_time = sum(log.get("response_time_ms", 0) for log in logs) / total_interactions
-        avg_prompt_length = sum(log.get("prompt_length", 0) for log in logs) / total_interactions
-        
-        # Recent interactions (last 24 hours)
-        now = datetime.utcnow()
-        recent_count = 0
-        for log in logs:
-            try:
-                log_time = datetime.fromisoformat(log["timestamp"].replace('Z', '+00:00'))
-                if (now - log_time.replace(tzinfo=None)).total_seconds() < 86400:
-                    recent_count += 1
-            except:
-                continue
-        
-        # Streaming vs regular requests
-        streaming_requests = sum(1 for log in logs if log.get("stream", False))
-        regular_requests = total_interactions - streaming_requests
-        
-        return {
-            "total_interactions": total_interactions,
-            "avg_response_time_ms": round(avg_response_time, 2),
-            "avg_prompt_length": round(avg_prompt_length, 2),
-            "recent_interactions": recent_count,
-            "streaming_requests": streaming_requests,
-            "regular_requests": regular_requests,
-            "ollama_model": OLLAMA_MODEL
-        }
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=ErrorResponse(
-                error="Failed to read log statistics",
-                detail=str(e)
-            ).model_dump()
-        )
+
+    # Recent interactions (last 24 hours) - drop expired timestamps first
+    recent = stats["recent"]
+    cutoff = time.time() - 86400
+    while recent and recent[0] < cutoff:
+        recent.popleft()
+
+    streaming_requests = stats["streaming"]
+
+    return {
+        "total_interactions": total_interactions,
+        "avg_response_time_ms": round(stats["sum_response_time_ms"] / total_interactions, 2),
+        "min_response_time_ms": stats["min_response_time_ms"],
+        "max_response_time_ms": stats["max_response_time_ms"],
+        "avg_prompt_length": round(stats["sum_prompt_length"] / total_interactions, 2),
+        "recent_interactions": len(recent),
+        "streaming_requests": streaming_requests,
+        "regular_requests": total_interactions - streaming_requests,
+        "model_usage": dict(stats["model_usage"]),
+        "ollama_model": OLLAMA_MODEL
+    }
 
 if __name__ == "__main__":
-    uvicorn.run(
-        "app:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,
-        log_level="info"
-    ) 
\ No newline at end of file
+    if os.getenv("DEV"):
+        # Development mode: auto-reload, single worker
+        uvicorn.run(
+            "app:app",
+            host="0.0.0.0",
+            port=8000,
+            reload=True,
+            log_level="info"
+        )
+    else:
+        # uvloop + httptools ship with uvicorn[standard]; caches and the
+        # logger are per-worker process
+        uvicorn.run(
+            "app:app",
+            host="0.0.0.0",
+            port=8000,
+            loop="uvloop",
+            http="httptools",
+            workers=int(os.getenv("WEB_CONCURRENCY", (os.cpu_count() or 1) * 2 + 1)),
+            log_level="info"
+        )
\ No newline at end of file